@@ -20,60 +20,62 @@ app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
 # In-memory activity database
+# Participants are kept as dict keys: membership checks are constant-time and,
+# unlike a set, signup order is preserved when they are listed
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": dict.fromkeys(["michael@mergington.edu", "daniel@mergington.edu"])
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": dict.fromkeys(["emma@mergington.edu", "sophia@mergington.edu"])
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": dict.fromkeys(["john@mergington.edu", "olivia@mergington.edu"])
     },
     "Basketball Team": {
         "description": "Competitive basketball training and inter-school matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "liam@mergington.edu"]
+        "participants": dict.fromkeys(["james@mergington.edu", "liam@mergington.edu"])
     },
     "Swimming Club": {
         "description": "Swimming lessons and competitive training",
         "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["ava@mergington.edu"]
+        "participants": dict.fromkeys(["ava@mergington.edu"])
     },
     "Art Studio": {
         "description": "Explore painting, drawing, and mixed media art",
         "schedule": "Mondays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["isabella@mergington.edu", "mia@mergington.edu"]
+        "participants": dict.fromkeys(["isabella@mergington.edu", "mia@mergington.edu"])
     },
     "Drama Club": {
         "description": "Acting, theater production, and performance arts",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["noah@mergington.edu", "emily@mergington.edu"]
+        "participants": dict.fromkeys(["noah@mergington.edu", "emily@mergington.edu"])
     },
     "Debate Team": {
         "description": "Develop critical thinking and public speaking skills through debates",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 16,
-        "participants": ["william@mergington.edu"]
+        "participants": dict.fromkeys(["william@mergington.edu"])
     },
     "Science Olympiad": {
         "description": "Competitive science and engineering challenges",
         "schedule": "Fridays, 3:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["charlotte@mergington.edu", "ethan@mergington.edu"]
+        "participants": dict.fromkeys(["charlotte@mergington.edu", "ethan@mergington.edu"])
     }
 }
 
@@ -85,7 +87,10 @@ def root():
 
 @app.get("/activities")
 def get_activities():
-    return activities
+    return {
+        name: {**activity, "participants": list(activity["participants"])}
+        for name, activity in activities.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
@@ -102,7 +107,7 @@ def signup_for_activity(activity_name: str, email: str):
     # Validate student is not already signed up
     if email in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
-    activity["participants"].append(email)
+    activity["participants"][email] = None
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -120,5 +125,5 @@ def unregister_from_activity(activity_name: str, email: str):
     if email not in activity["participants"]:
         raise HTTPException(status_code=400, detail="Student is not registered for this activity")
     
-    activity["participants"].remove(email)
+    del activity["participants"][email]
     return {"message": f"Unregistered {email} from {activity_name}"}
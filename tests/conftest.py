@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import app, activities
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the API, shared across the whole session"""
+    # Entering the client starts its anyio portal and the app lifespan; keeping
+    # it entered for the session means every test reuses that one portal
+    # instead of TestClient spinning up a fresh one per request
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+# Pristine copy of the in-memory database, snapshotted from the app at import
+# before any test has run, so it cannot drift from the data in src/app.py
+_ACTIVITIES_TEMPLATE = {
+    name: {**details, "participants": copy.copy(details["participants"])}
+    for name, details in activities.items()
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request):
+    """Restore activities data after each test that may modify it"""
+    yield
+    # Restoring on teardown leaves the data pristine for whichever test runs
+    # next, so read-only tests marked `noreset` can skip the restore entirely
+    if request.node.get_closest_marker("noreset"):
+        return
+    # Only the participants rosters are mutated by tests, so copy just those
+    activities.clear()
+    activities.update({
+        name: {**details, "participants": copy.copy(details["participants"])}
+        for name, details in _ACTIVITIES_TEMPLATE.items()
+    })
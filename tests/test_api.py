@@ -2,94 +2,26 @@
 Test suite for the Mergington High School Activities API
 """
 
+import asyncio
+
 import pytest
-from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
 from src.app import app, activities
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the API"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Save original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and inter-school matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "liam@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Swimming lessons and competitive training",
-            "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["ava@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and mixed media art",
-            "schedule": "Mondays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["isabella@mergington.edu", "mia@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Acting, theater production, and performance arts",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["noah@mergington.edu", "emily@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop critical thinking and public speaking skills through debates",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["william@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Competitive science and engineering challenges",
-            "schedule": "Fridays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["charlotte@mergington.edu", "ethan@mergington.edu"]
-        }
-    }
-    
-    # Reset to original state before each test
-    activities.clear()
-    activities.update(original_activities)
-    yield
-
-
+@pytest.mark.noreset
 class TestRootEndpoint:
     """Test cases for the root endpoint"""
     
-    def test_root_redirects_to_static_index(self, client):
+    def test_root_redirects_to_static_index(self):
         """Test that root path redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        root = next(r for r in app.router.routes if getattr(r, "path", None) == "/")
+        response = root.endpoint()
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.noreset
 class TestGetActivities:
     """Test cases for GET /activities endpoint"""
     
@@ -109,19 +41,19 @@ class TestGetActivities:
         data = response.json()
         chess_club = data["Chess Club"]
         assert "participants" in chess_club
-        assert "michael@mergington.edu" in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
+        assert chess_club["participants"] == [
+            "michael@mergington.edu",
+            "daniel@mergington.edu"
+        ]
     
     def test_get_activities_includes_all_fields(self, client):
         """Test that activities include all required fields"""
         response = client.get("/activities")
         assert response.status_code == 200
         data = response.json()
+        required = {"description", "schedule", "max_participants", "participants"}
         for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
+            assert required <= activity_data.keys(), activity_name
 
 
 class TestSignupForActivity:
@@ -130,7 +62,8 @@ class TestSignupForActivity:
     def test_signup_new_student_success(self, client):
         """Test successful signup of a new student"""
         response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            "/activities/Chess Club/signup",
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
@@ -139,46 +72,51 @@ class TestSignupForActivity:
         assert "Chess Club" in data["message"]
         
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
     def test_signup_duplicate_student_fails(self, client):
         """Test that signing up an already registered student fails"""
         # First signup should succeed
         response1 = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            "/activities/Chess Club/signup",
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response1.status_code == 200
         
         # Second signup should fail
         response2 = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            "/activities/Chess Club/signup",
+            params={"email": "newstudent@mergington.edu"}
         )
         assert response2.status_code == 400
         data = response2.json()
         assert "already signed up" in data["detail"].lower()
     
-    def test_signup_nonexistent_activity_fails(self, client):
-        """Test that signing up for a non-existent activity fails"""
-        response = client.post(
-            "/activities/Nonexistent%20Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-    
     def test_signup_with_special_characters_in_activity_name(self, client):
         """Test signup works with URL-encoded activity names"""
         response = client.post(
-            "/activities/Programming%20Class/signup?email=coder@mergington.edu"
+            "/activities/Programming%20Class/signup",
+            params={"email": "coder@mergington.edu"}
         )
         assert response.status_code == 200
         
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "coder@mergington.edu" in activities_data["Programming Class"]["participants"]
+        assert "coder@mergington.edu" in activities["Programming Class"]["participants"]
+    
+    def test_signup_appends_to_end_of_participant_list(self, client):
+        """Test that new participants are listed after existing ones"""
+        response = client.post(
+            "/activities/Chess Club/signup",
+            params={"email": "newstudent@mergington.edu"}
+        )
+        assert response.status_code == 200
+        
+        data = client.get("/activities").json()
+        assert data["Chess Club"]["participants"] == [
+            "michael@mergington.edu",
+            "daniel@mergington.edu",
+            "newstudent@mergington.edu"
+        ]
 
 
 class TestUnregisterFromActivity:
@@ -187,13 +125,12 @@ class TestUnregisterFromActivity:
     def test_unregister_existing_student_success(self, client):
         """Test successful unregistration of an existing student"""
         # Verify student exists first
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" in activities["Chess Club"]["participants"]
         
         # Unregister student
         response = client.delete(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
+            "/activities/Chess Club/unregister",
+            params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 200
         data = response.json()
@@ -202,46 +139,42 @@ class TestUnregisterFromActivity:
         assert "Chess Club" in data["message"]
         
         # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
-    
-    def test_unregister_nonregistered_student_fails(self, client):
-        """Test that unregistering a non-registered student fails"""
-        response = client.delete(
-            "/activities/Chess%20Club/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert "not registered" in data["detail"].lower()
-    
-    def test_unregister_from_nonexistent_activity_fails(self, client):
-        """Test that unregistering from a non-existent activity fails"""
-        response = client.delete(
-            "/activities/Nonexistent%20Activity/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
     def test_unregister_and_resign_up(self, client):
         """Test that a student can unregister and then sign up again"""
         # Unregister
         response1 = client.delete(
-            "/activities/Chess%20Club/unregister?email=michael@mergington.edu"
+            "/activities/Chess Club/unregister",
+            params={"email": "michael@mergington.edu"}
         )
         assert response1.status_code == 200
         
         # Sign up again
         response2 = client.post(
-            "/activities/Chess%20Club/signup?email=michael@mergington.edu"
+            "/activities/Chess Club/signup",
+            params={"email": "michael@mergington.edu"}
         )
         assert response2.status_code == 200
         
         # Verify student is registered again
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" in activities["Chess Club"]["participants"]
+
+
+class TestErrorResponses:
+    """Test cases for requests the API rejects"""
+    
+    @pytest.mark.parametrize("method,url,email,status,needle", [
+        ("POST", "/activities/Nonexistent Activity/signup", "student@mergington.edu", 404, "not found"),
+        ("DELETE", "/activities/Nonexistent Activity/unregister", "student@mergington.edu", 404, "not found"),
+        ("DELETE", "/activities/Chess Club/unregister", "notregistered@mergington.edu", 400, "not registered"),
+    ], ids=["signup-unknown-activity", "unregister-unknown-activity", "unregister-not-registered"])
+    def test_invalid_request_fails(self, client, method, url, email, status, needle):
+        """Test that unknown activities and unregistered students are rejected"""
+        response = client.request(method, url, params={"email": email})
+        assert response.status_code == status
+        data = response.json()
+        assert needle in data["detail"].lower()
 
 
 class TestIntegrationScenarios:
@@ -257,29 +190,29 @@ class TestIntegrationScenarios:
         
         # 2. Sign up new student
         signup_response = client.post(
-            "/activities/Swimming%20Club/signup?email=swimmer@mergington.edu"
+            "/activities/Swimming Club/signup",
+            params={"email": "swimmer@mergington.edu"}
         )
         assert signup_response.status_code == 200
         
         # 3. Verify student was added
-        verify_response = client.get("/activities")
-        verify_data = verify_response.json()
-        assert len(verify_data["Swimming Club"]["participants"]) == initial_count + 1
-        assert "swimmer@mergington.edu" in verify_data["Swimming Club"]["participants"]
+        participants = activities["Swimming Club"]["participants"]
+        assert len(participants) == initial_count + 1
+        assert "swimmer@mergington.edu" in participants
         
         # 4. Unregister student
         unregister_response = client.delete(
-            "/activities/Swimming%20Club/unregister?email=swimmer@mergington.edu"
+            "/activities/Swimming Club/unregister",
+            params={"email": "swimmer@mergington.edu"}
         )
         assert unregister_response.status_code == 200
         
         # 5. Verify student was removed
-        final_response = client.get("/activities")
-        final_data = final_response.json()
-        assert len(final_data["Swimming Club"]["participants"]) == initial_count
-        assert "swimmer@mergington.edu" not in final_data["Swimming Club"]["participants"]
+        assert len(participants) == initial_count
+        assert "swimmer@mergington.edu" not in participants
     
-    def test_multiple_students_same_activity(self, client):
+    @pytest.mark.asyncio
+    async def test_multiple_students_same_activity(self):
         """Test multiple students can sign up for the same activity"""
         students = [
             "student1@mergington.edu",
@@ -287,14 +220,16 @@ class TestIntegrationScenarios:
             "student3@mergington.edu"
         ]
         
-        for student in students:
-            response = client.post(
-                f"/activities/Art%20Studio/signup?email={student}"
-            )
+        # Each student has a distinct email, so the signups can run concurrently
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            requests = [
+                ac.build_request("POST", "/activities/Art Studio/signup", params={"email": student})
+                for student in students
+            ]
+            responses = await asyncio.gather(*[ac.send(request) for request in requests])
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all students are registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
         for student in students:
-            assert student in activities_data["Art Studio"]["participants"]
+            assert student in activities["Art Studio"]["participants"]
@@ -0,0 +1,69 @@
+"""
+Benchmarks for the Mergington High School Activities API
+
+These pin signup cost as roster size grows, so a regression from hashed
+participants back to lists shows up as time scaling with the roster. The
+handlers are called directly rather than over HTTP, because the ASGI stack
+costs far more than a list scan and would hide it. Run the timed benchmarks
+with `pytest tests/test_perf.py --benchmark-enable --benchmark-only`, which
+also compares each roster size against the smallest one; in a normal run
+benchmarking is disabled, the cases execute once untimed, and only the
+deterministic container check guards against lists.
+"""
+
+import pytest
+from src.app import activities, signup_for_activity, unregister_from_activity
+
+NEW_STUDENT = "newstudent@mergington.edu"
+
+ROSTER_SIZES = [10, 1000, 10000]
+
+# Fastest signup time per roster size, filled in as the timed cases run
+_BEST_TIMES = {}
+
+
+def _add_activity_with_roster(name, roster_size):
+    """Add an activity whose roster uses the same container type as the app"""
+    roster_type = type(next(iter(activities.values()))["participants"])
+    activities[name] = {
+        "description": "",
+        "schedule": "",
+        "max_participants": roster_size + 1,
+        "participants": roster_type()
+    }
+    for i in range(roster_size):
+        signup_for_activity(name, f"student{i}@mergington.edu")
+
+
+def test_rosters_use_hashed_containers():
+    """Test that every roster supports constant-time membership checks"""
+    for name, activity in activities.items():
+        assert isinstance(activity["participants"], (dict, set)), name
+
+
+@pytest.mark.parametrize("roster_size", ROSTER_SIZES)
+def test_signup_large_activity(benchmark, roster_size):
+    """Benchmark signing up for an activity with a large roster"""
+    _add_activity_with_roster("Benchmark Club", roster_size)
+
+    def drop_new_student():
+        if NEW_STUDENT in activities["Benchmark Club"]["participants"]:
+            unregister_from_activity("Benchmark Club", NEW_STUDENT)
+
+    # Drop the new student before each round so every call is a fresh signup
+    result = benchmark.pedantic(
+        signup_for_activity,
+        args=("Benchmark Club", NEW_STUDENT),
+        setup=drop_new_student,
+        rounds=100
+    )
+    assert NEW_STUDENT in result["message"]
+
+    if not benchmark.enabled:
+        return
+    _BEST_TIMES[roster_size] = benchmark.stats.stats.min
+    # The smallest size runs first; a list scan over 1000+ emails makes the
+    # larger cases tens of times slower than it, a hashed roster does not
+    baseline = _BEST_TIMES.get(ROSTER_SIZES[0])
+    if baseline is not None and roster_size != ROSTER_SIZES[0]:
+        assert _BEST_TIMES[roster_size] < 5 * baseline